@@ -63,8 +63,8 @@ async def handle_download_process(
 
     else:
         download_link, filename = await get_download_info(url, soup)
-        live_manager.add_overall_task(identifier, num_tasks=1)
-        task = live_manager.add_task()
+        overall_id = live_manager.add_overall_task(identifier, num_tasks=1)
+        task = live_manager.add_task(overall_id=overall_id)
 
         downloader = MediaDownloader(
             session_info=session_info,
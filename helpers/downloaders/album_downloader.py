@@ -6,7 +6,9 @@ extraction with memory-based processing.
 """
 
 import asyncio
+import os
 from asyncio import Semaphore
+from concurrent.futures import ThreadPoolExecutor
 
 from helpers.config import MAX_WORKERS, AlbumInfo, DownloadInfo, SessionInfo
 from helpers.crawlers.crawler_utils import get_download_info
@@ -33,6 +35,12 @@ class AlbumDownloader:
         self.album_info = album_info
         self.live_manager = live_manager
         self.failed_downloads = []
+        self._overall_task_id = None
+        # Reused across all items in the album; asyncio.to_thread would pay
+        # context-copy overhead and thread churn on every download
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=MAX_WORKERS, thread_name_prefix="bunkr-dl",
+        )
 
     async def execute_item_download(
         self,
@@ -42,7 +50,9 @@ class AlbumDownloader:
     ) -> None:
         """Handle the download of an individual item in the album."""
         async with semaphore:
-            task = self.live_manager.add_task(current_task=current_task)
+            task = self.live_manager.add_task(
+                current_task=current_task, overall_id=self._overall_task_id,
+            )
 
             # Process the download of an item
             item_soup = await fetch_page(item_page)
@@ -113,7 +123,9 @@ class AlbumDownloader:
                         live_manager=self.live_manager,
                     )
 
-                    failed_download = await asyncio.to_thread(downloader.download)
+                    failed_download = await asyncio.get_running_loop().run_in_executor(
+                        self._io_pool, downloader.download,
+                    )
                     if failed_download:
                         self.failed_downloads.append(failed_download)
 
@@ -130,8 +142,10 @@ class AlbumDownloader:
             live_manager=self.live_manager,
             retries=1,  # Retry once for failed downloads
         )
-        # Run the synchronous download function in a separate thread
-        await asyncio.to_thread(downloader.download)
+        # Run the synchronous download function in the shared download pool
+        await asyncio.get_running_loop().run_in_executor(
+            self._io_pool, downloader.download,
+        )
 
     async def process_failed_downloads(self) -> None:
         """Process any failed downloads after the initial attempt."""
@@ -143,15 +157,37 @@ class AlbumDownloader:
             )
         self.failed_downloads.clear()
 
+    @staticmethod
+    def _effective_workers(max_workers: int, *, extract_frames: bool) -> int:
+        """Adapt the concurrency cap to the workload type.
+
+        Plain downloads are I/O-bound and can use the configured cap as-is.
+        With frame extraction each worker also burns CPU cores in the analysis
+        pool, so the cap shrinks to half the usable cores (minimum 2) to avoid
+        oversubscribing the CPU.
+        """
+        if not extract_frames:
+            return max_workers
+
+        if hasattr(os, "sched_getaffinity"):
+            cpu_count = len(os.sched_getaffinity(0))
+        else:
+            cpu_count = os.cpu_count() or 2
+        return min(max_workers, max(2, cpu_count // 2))
+
     async def download_album(self, max_workers: int = MAX_WORKERS) -> None:
         """Handle the album download."""
         num_tasks = len(self.album_info.item_pages)
-        self.live_manager.add_overall_task(
+        self._overall_task_id = self.live_manager.add_overall_task(
             description=self.album_info.album_id,
             num_tasks=num_tasks,
         )
 
         # Create tasks for downloading each item in the album
+        max_workers = self._effective_workers(
+            max_workers,
+            extract_frames=getattr(self.session_info.args, "extract_frames", False),
+        )
         semaphore = asyncio.Semaphore(max_workers)
         tasks = [
             self.execute_item_download(item_page, current_task, semaphore)
@@ -162,3 +198,5 @@ class AlbumDownloader:
         # If there are failed downloads, process them after all downloads are complete
         if self.failed_downloads:
             await self.process_failed_downloads()
+
+        self._io_pool.shutdown(wait=True)
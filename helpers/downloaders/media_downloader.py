@@ -60,6 +60,10 @@ class MediaDownloader:
         """
         ignore_list = getattr(self.session_info.args, "ignore", [])
         include_list = getattr(self.session_info.args, "include", [])
+        # Compiled alternations, when the caller provides them, replace the
+        # per-word substring loop with a single C-level scan
+        ignore_re = getattr(self.session_info.args, "ignore_re", None)
+        include_re = getattr(self.session_info.args, "include_re", None)
 
         def log_skip_event(reason: str) -> bool:
             """Log the skip reason and updates the task before."""
@@ -76,17 +80,27 @@ class MediaDownloader:
             )
 
         # Check if the file is in the ignore list
-        if ignore_list and any(
-            word in self.download_info.filename for word in ignore_list
-        ):
+        matches_ignore = (
+            ignore_re.search(self.download_info.filename) is not None
+            if ignore_re is not None
+            else ignore_list and any(
+                word in self.download_info.filename for word in ignore_list
+            )
+        )
+        if matches_ignore:
             return log_skip_event(
                 f"{self.download_info.filename} matches the ignore list.",
             )
 
         # Check if the file is not in the include list
-        if include_list and all(
-            word not in self.download_info.filename for word in include_list
-        ):
+        missing_include = (
+            include_re.search(self.download_info.filename) is None
+            if include_re is not None
+            else include_list and all(
+                word not in self.download_info.filename for word in include_list
+            )
+        )
+        if missing_include:
             return log_skip_event(
                 f"No included words found for {self.download_info.filename}.",
             )
@@ -30,6 +30,10 @@ from .config import (
 from .file_utils import write_on_session_log
 from .url_utils import change_domain_to_cr
 
+# Shared session so page fetches reuse pooled keep-alive connections instead
+# of paying a new TCP + TLS handshake on every request.
+_SESSION = requests.Session()
+
 
 def validate_download_link(download_link: str) -> bool:
     """Check if a download link is accessible."""
@@ -63,7 +67,7 @@ async def fetch_page(url: str, retries: int = 5) -> BeautifulSoup | None:
 
     for attempt in range(retries):
         try:
-            response = requests.Session().get(url, timeout=40)
+            response = _SESSION.get(url, timeout=40)
             if response.status_code == HTTP_STATUS_FORBIDDEN and not tried_cr:
                 tried_cr = True
                 url = change_domain_to_cr(url)
@@ -39,23 +39,41 @@ class ProgressManager:
         self.task_progress = self._create_progress_bar()
         self.num_tasks = 0
         self.overall_buffer = deque(maxlen=overall_buffer_size)
+        # Map item tasks to the overall task (album) they belong to, so
+        # concurrently running albums each advance their own overall bar
+        self.overall_totals: dict[int, int] = {}
+        self.task_to_overall: dict[int, int] = {}
 
-    def add_overall_task(self, description: str, num_tasks: int) -> None:
-        """Add an overall progress task with a given description and total tasks."""
+    def add_overall_task(self, description: str, num_tasks: int) -> int:
+        """Add an overall progress task and return its task id."""
         self.num_tasks = num_tasks
         overall_description = self._adjust_description(description)
-        self.overall_progress.add_task(
+        overall_id = self.overall_progress.add_task(
             f"[{self.color}]{overall_description}",
             total=num_tasks,
             completed=0,
         )
+        self.overall_totals[overall_id] = num_tasks
+        return overall_id
 
-    def add_task(self, current_task: int = 0, total: int = 100) -> int:
-        """Add an individual task to the task progress bar."""
+    def add_task(
+        self,
+        current_task: int = 0,
+        total: int = 100,
+        overall_id: int | None = None,
+    ) -> int:
+        """Add an individual task tied to the given (or latest) overall task."""
+        if overall_id is None and self.overall_progress.tasks:
+            overall_id = self.overall_progress.tasks[-1].id
+
+        num_tasks = self.overall_totals.get(overall_id, self.num_tasks)
         task_description = (
-            f"[{self.color}]{self.item_description} {current_task + 1}/{self.num_tasks}"
+            f"[{self.color}]{self.item_description} {current_task + 1}/{num_tasks}"
         )
-        return self.task_progress.add_task(task_description, total=total)
+        task_id = self.task_progress.add_task(task_description, total=total)
+        if overall_id is not None:
+            self.task_to_overall[task_id] = overall_id
+        return task_id
 
     def update_task(
         self,
@@ -97,17 +115,27 @@ class ProgressManager:
 
     # Private methods
     def _update_overall_task(self, task_id: int) -> None:
-        """Advance the overall progress bar and removes old tasks."""
-        # Access the latest task dynamically
-        current_overall_task = self.overall_progress.tasks[-1]
+        """Advance the owning overall progress bar and removes old tasks."""
+        # Resolve the overall task this item belongs to; fall back to the
+        # latest one for tasks added without an explicit owner
+        overall_id = self.task_to_overall.get(task_id)
+        if overall_id is None and self.overall_progress.tasks:
+            overall_id = self.overall_progress.tasks[-1].id
+
+        current_overall_task = next(
+            (task for task in self.overall_progress.tasks if task.id == overall_id),
+            None,
+        )
+        if current_overall_task is None:
+            return
 
         # If the task is finished, remove it and update the overall progress
         if self.task_progress.tasks[task_id].finished:
             self.overall_progress.advance(current_overall_task.id)
             self.task_progress.update(task_id, visible=False)
 
-        # Track completed overall tasks
-        if current_overall_task.finished:
+        # Track completed overall tasks (once each)
+        if current_overall_task.finished and current_overall_task not in self.overall_buffer:
             self.overall_buffer.append(current_overall_task)
 
         # Cleanup completed overall tasks
@@ -19,6 +19,7 @@ from .video_utils import (
     is_video_file,
     get_video_stem,
     sanitize_video_folder_name,
+    frame_count_for_duration,
     estimate_frame_count_by_duration
 )
 
@@ -37,5 +38,6 @@ __all__ = [
     "is_video_file",
     "get_video_stem", 
     "sanitize_video_folder_name",
+    "frame_count_for_duration",
     "estimate_frame_count_by_duration"
 ]
@@ -1,38 +1,220 @@
 """Frame extraction functionality refactored from stream_keyframes.py."""
 
 import asyncio
-import io
-import math
+import heapq
 import os
 import subprocess
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple, Optional
 
 import numpy as np
+import requests
 from PIL import Image
+from scipy import ndimage
+from scipy.fft import dct as _dct
 
-from .video_utils import sanitize_video_folder_name
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+from .video_utils import frame_count_for_duration, sanitize_video_folder_name
+
+# When decoding sequentially with PyAV, a timestamp this close ahead of the
+# current position is reached by decoding forward instead of re-seeking.
+SEEK_AHEAD_THRESHOLD = 10.0
+
+# Cap on concurrent ffmpeg grabs in the fallback path, to avoid overwhelming
+# the origin server with parallel connections.
+FFMPEG_CONCURRENCY = 8
+
+# Resolution of the grayscale frames used for candidate analysis. ffmpeg's
+# libswscale does the resize + grayscale conversion for free on its side.
+RAW_ANALYSIS_WIDTH = 256
+RAW_ANALYSIS_HEIGHT = 144
+
+# pHash input is always 32x32 (hash_size 8 x highfreq_factor 4), so the DCT-II
+# can be precomputed once as a matrix and applied as two small matmuls.
+PHASH_SIZE = 32
+_DCT_MATRIX = _dct(np.eye(PHASH_SIZE, dtype=np.float32), axis=0, norm="ortho")
+
+# Shared pool for CPU-bound frame analysis. numpy releases the GIL only in
+# spots, so with several albums' worth of concurrent extractions the analysis
+# work would otherwise serialize on the event-loop process. Created lazily and
+# kept alive across videos; only small uint8 arrays cross the pickle boundary.
+_FRAME_EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+
+def _get_frame_executor() -> Optional[ProcessPoolExecutor]:
+    """Return the shared analysis process pool (None = default thread pool)."""
+    global _FRAME_EXECUTOR
+    if _FRAME_EXECUTOR is None:
+        try:
+            _FRAME_EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+        except OSError:
+            return None
+    return _FRAME_EXECUTOR
+
+
+# Durations already probed in this session, keyed by URL/path. Retried items
+# and re-runs over the same album skip the extra ffprobe process + connection.
+_DURATION_CACHE: dict = {}
 
 
 def run_ffprobe_duration(url_or_path: str) -> Optional[float]:
     """Return duration in seconds (float) using ffprobe. None if unknown/fails."""
+    if url_or_path in _DURATION_CACHE:
+        return _DURATION_CACHE[url_or_path]
+
     cmd = [
         "ffprobe", "-v", "error",
         "-show_entries", "format=duration",
         "-of", "default=nw=1:nk=1",
         url_or_path
     ]
+    duration = None
     try:
         out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
         s = out.decode("utf-8", errors="ignore").strip()
         if s:
-            return float(s)
+            duration = float(s)
+    except Exception:
+        duration = None
+
+    _DURATION_CACHE[url_or_path] = duration
+    return duration
+
+
+# Containers whose duration can be read from the MP4 'mvhd' box without
+# spawning ffprobe (which costs a process fork plus its own HTTP connection).
+_MP4_EXTENSIONS = {".mp4", ".m4v", ".mov"}
+
+# How many bytes to fetch from each end of the file when looking for 'moov'.
+_MOOV_PROBE_BYTES = 65536
+
+
+def _parse_mvhd_duration(data: bytes) -> Optional[float]:
+    """Parse duration in seconds from an MP4 'mvhd' box found in data."""
+    idx = data.find(b"mvhd")
+    if idx == -1 or idx + 24 > len(data):
+        return None
+
+    version = data[idx + 4]
+    if version == 1:
+        if idx + 36 > len(data):
+            return None
+        timescale = int.from_bytes(data[idx + 24:idx + 28], "big")
+        duration = int.from_bytes(data[idx + 28:idx + 36], "big")
+    else:
+        timescale = int.from_bytes(data[idx + 16:idx + 20], "big")
+        duration = int.from_bytes(data[idx + 20:idx + 24], "big")
+
+    if timescale <= 0 or duration <= 0:
+        return None
+    return duration / timescale
+
+
+def _is_remote(url_or_path: str) -> bool:
+    """True for http(s) inputs, False for local paths."""
+    return url_or_path.startswith(("http://", "https://"))
+
+
+def get_video_duration(url_or_path: str) -> Optional[float]:
+    """Return video duration in seconds, avoiding ffprobe for MP4 URLs.
+
+    For MP4-family URLs the 'moov' box is fetched with two small ranged GETs
+    (head, then tail for faststart-less files) and parsed in-process. Anything
+    else — or a failed parse — falls back to run_ffprobe_duration. Results are
+    cached per URL either way.
+    """
+    if url_or_path in _DURATION_CACHE:
+        return _DURATION_CACHE[url_or_path]
+
+    is_mp4_url = (
+        _is_remote(url_or_path)
+        and Path(url_or_path.split("?", 1)[0]).suffix.lower() in _MP4_EXTENSIONS
+    )
+    if is_mp4_url:
+        for byte_range in (f"bytes=0-{_MOOV_PROBE_BYTES - 1}", f"bytes=-{_MOOV_PROBE_BYTES}"):
+            try:
+                response = requests.get(
+                    url_or_path, headers={"Range": byte_range}, timeout=15,
+                    stream=True,
+                )
+                # Anything but 206 means the server ignored Range and is
+                # sending the whole file; bail out before buffering the body
+                if response.status_code != 206:
+                    response.close()
+                    break
+                data = response.content
+            except requests.RequestException:
+                break
+            duration = _parse_mvhd_duration(data)
+            if duration is not None:
+                _DURATION_CACHE[url_or_path] = duration
+                return duration
+
+    return run_ffprobe_duration(url_or_path)
+
+
+def run_ffprobe_keyframes(url_or_path: str) -> Optional[List[float]]:
+    """Return sorted keyframe timestamps (seconds) using one ffprobe call.
+
+    Reads packet metadata only (no decoding) and keeps packets flagged as
+    keyframes. Returns None if probing fails or yields nothing.
+    """
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "packet=pts_time,flags",
+        "-of", "csv=p=0",
+        url_or_path
+    ]
+    try:
+        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
     except Exception:
         return None
-    return None
+
+    keyframes = []
+    for line in out.decode("utf-8", errors="ignore").splitlines():
+        parts = line.split(",")
+        if len(parts) >= 2 and "K" in parts[1]:
+            try:
+                keyframes.append(float(parts[0]))
+            except ValueError:
+                continue
+
+    if not keyframes:
+        return None
+    keyframes.sort()
+    return keyframes
+
+
+def snap_timestamps_to_keyframes(timestamps: List[float], keyframes: List[float]) -> List[float]:
+    """Snap each timestamp to the nearest keyframe and drop duplicates.
+
+    Seeking lands on keyframe boundaries anyway; sampling them directly means
+    every grab decodes exactly one frame with zero decode-forward work, and
+    candidates that collapse onto the same keyframe are fetched only once.
+    """
+    kf = np.asarray(keyframes)
+    idx = np.searchsorted(kf, timestamps)
+    snapped = []
+    seen = set()
+    for t, i in zip(timestamps, idx):
+        # Pick the closer of the two neighbouring keyframes
+        left = kf[max(i - 1, 0)]
+        right = kf[min(i, len(kf) - 1)]
+        nearest = float(left if abs(t - left) <= abs(right - t) else right)
+        if nearest not in seen:
+            seen.add(nearest)
+            snapped.append(nearest)
+    return snapped
 
 
 def sample_candidate_timestamps(duration: Optional[float], target_frames: int, multiplier: float, max_candidates: int) -> List[float]:
@@ -50,29 +232,50 @@ def sample_candidate_timestamps(duration: Optional[float], target_frames: int, m
     return [start + i * step for i in range(n_cand)]
 
 
-def ffmpeg_grab_frame_at(url_or_path: str, t: float, jpeg_quality: int = 2, headers: Optional[List[str]] = None) -> Optional[bytes]:
-    """Return a single JPEG frame as bytes by seeking to t seconds on the input URL/path."""
+def _ffmpeg_frame_cmd(url_or_path: str, t: float, jpeg_quality: int, headers: Optional[List[str]]) -> List[str]:
+    """Build the ffmpeg command line for grabbing a single frame at t seconds.
+
+    The `-ss` is emitted first (input seeking) together with `-seek_timestamp 1`
+    and (for http inputs) `-seekable 1`, so ffmpeg issues a ranged HTTP GET near the target
+    instead of reading the stream from byte 0 — extraction time stays constant
+    regardless of how late in the video the timestamp is. `-noaccurate_seek`
+    lands on the nearest keyframe, which is accurate enough for candidate
+    sampling and avoids decoding forward from the preceding keyframe.
+    """
     cmd = [
         "ffmpeg",
         "-hide_banner", "-loglevel", "error",
         "-nostdin",
-        "-reconnect", "1",
-        "-reconnect_streamed", "1",
-        "-reconnect_at_eof", "1",
-        "-rw_timeout", "60000000",  # 60s in microseconds
         "-ss", f"{max(0.0, t):.3f}",
+        "-seek_timestamp", "1",
+        "-noaccurate_seek",
     ]
+    if _is_remote(url_or_path):
+        # http-protocol options; passing them for local files would trip the
+        # CLI's unknown-option check
+        cmd += [
+            "-reconnect", "1",
+            "-reconnect_streamed", "1",
+            "-reconnect_at_eof", "1",
+            "-rw_timeout", "60000000",  # 60s in microseconds
+            "-seekable", "1",
+        ]
     if headers:
         for h in headers:
             cmd += ["-headers", h]
     cmd += [
-        "-http_seekable", "1",
         "-i", url_or_path,
         "-frames:v", "1",
         "-f", "image2pipe",
         "-q:v", str(jpeg_quality),
         "pipe:1",
     ]
+    return cmd
+
+
+def ffmpeg_grab_frame_at(url_or_path: str, t: float, jpeg_quality: int = 2, headers: Optional[List[str]] = None) -> Optional[bytes]:
+    """Return a single JPEG frame as bytes by seeking to t seconds on the input URL/path."""
+    cmd = _ffmpeg_frame_cmd(url_or_path, t, jpeg_quality, headers)
     try:
         out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
         return out
@@ -80,38 +283,300 @@ def ffmpeg_grab_frame_at(url_or_path: str, t: float, jpeg_quality: int = 2, head
         return None
 
 
+async def ffmpeg_grab_frame_at_async(
+    url_or_path: str,
+    t: float,
+    jpeg_quality: int = 2,
+    headers: Optional[List[str]] = None,
+) -> Optional[bytes]:
+    """Async variant of ffmpeg_grab_frame_at that doesn't block the event loop."""
+    cmd = _ffmpeg_frame_cmd(url_or_path, t, jpeg_quality, headers)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, _ = await proc.communicate()
+    if proc.returncode != 0:
+        return None
+    return out
+
+
+def _ffmpeg_rawgray_cmd(url_or_path: str, t: float, headers: Optional[List[str]]) -> List[str]:
+    """Build an ffmpeg command that emits one analysis-sized raw grayscale frame.
+
+    Using `-f rawvideo -pix_fmt gray` skips the JPEG encode on ffmpeg's side and
+    the JPEG decode + full-resolution PIL allocation on ours; libswscale does
+    the resize and grayscale conversion with its own SIMD kernels.
+    """
+    cmd = [
+        "ffmpeg",
+        "-hide_banner", "-loglevel", "error",
+        "-nostdin",
+        "-ss", f"{max(0.0, t):.3f}",
+        "-seek_timestamp", "1",
+        "-noaccurate_seek",
+    ]
+    if _is_remote(url_or_path):
+        # http-protocol options; passing them for local files would trip the
+        # CLI's unknown-option check
+        cmd += [
+            "-reconnect", "1",
+            "-reconnect_streamed", "1",
+            "-reconnect_at_eof", "1",
+            "-rw_timeout", "60000000",  # 60s in microseconds
+            "-seekable", "1",
+        ]
+    if headers:
+        for h in headers:
+            cmd += ["-headers", h]
+    cmd += [
+        "-i", url_or_path,
+        "-frames:v", "1",
+        "-f", "rawvideo",
+        "-pix_fmt", "gray",
+        "-s", f"{RAW_ANALYSIS_WIDTH}x{RAW_ANALYSIS_HEIGHT}",
+        "pipe:1",
+    ]
+    return cmd
+
+
+async def ffmpeg_grab_gray_at_async(
+    url_or_path: str,
+    t: float,
+    headers: Optional[List[str]] = None,
+) -> Optional[np.ndarray]:
+    """Grab one analysis-sized uint8 grayscale frame at t seconds."""
+    cmd = _ffmpeg_rawgray_cmd(url_or_path, t, headers)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, _ = await proc.communicate()
+    frame_size = RAW_ANALYSIS_WIDTH * RAW_ANALYSIS_HEIGHT
+    if proc.returncode != 0 or len(out) < frame_size:
+        return None
+    return np.frombuffer(out[:frame_size], dtype=np.uint8).reshape(
+        RAW_ANALYSIS_HEIGHT, RAW_ANALYSIS_WIDTH,
+    )
+
+
+def extract_candidates_with_av(
+    video_url: str,
+    timestamps: List[float],
+) -> Optional[List[Tuple[float, np.ndarray]]]:
+    """Decode all candidate frames in a single PyAV streaming pass.
+
+    Opens the input once (one HTTP connection, one container probe) instead of
+    spawning one ffmpeg process per timestamp. Timestamps are visited in sorted
+    order; nearby ones are served by decoding forward from the current position
+    so a single keyframe seek can cover several candidates.
+
+    Returns a list of (timestamp, gray_array) tuples — analysis-sized uint8
+    grayscale frames, no JPEG round-trip — or None if the input could not be
+    handled by PyAV (caller falls back to ffmpeg).
+    """
+    if not PYAV_AVAILABLE:
+        return None
+
+    try:
+        container = av.open(video_url, options={"reconnect": "1"})
+    except Exception:
+        return None
+
+    results: List[Tuple[float, np.ndarray]] = []
+    try:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        time_base = float(stream.time_base) if stream.time_base else None
+        if time_base is None:
+            return None
+
+        current_pos = -1.0
+        for t in sorted(timestamps):
+            # Re-seek only when decoding forward would be wasteful
+            if t < current_pos or t - current_pos > SEEK_AHEAD_THRESHOLD:
+                container.seek(
+                    int(t / time_base), any_frame=False, backward=True, stream=stream,
+                )
+
+            frame_at_t = None
+            for frame in container.decode(stream):
+                if frame.pts is None:
+                    continue
+                frame_time = frame.pts * time_base
+                current_pos = frame_time
+                if frame_time >= t:
+                    frame_at_t = frame
+                    break
+
+            if frame_at_t is None:
+                continue
+
+            gray = frame_at_t.to_image().convert("L").resize(
+                (RAW_ANALYSIS_WIDTH, RAW_ANALYSIS_HEIGHT), Image.Resampling.BILINEAR,
+            )
+            results.append((float(t), np.asarray(gray, dtype=np.uint8)))
+
+    except Exception:
+        return None
+    finally:
+        container.close()
+
+    return results
+
+
+async def grab_candidates_batch_ffmpeg(
+    path: str,
+    timestamps: List[float],
+    keyframes: List[float],
+) -> Optional[List[Tuple[float, np.ndarray]]]:
+    """Dump every keyframe in one ffmpeg pass and slice out the candidates.
+
+    One process amortizes input open and codec init across all candidates:
+    `-skip_frame nokey` makes the decoder touch only keyframes, and the raw
+    grayscale output stream splits into frames at fixed WxH offsets. The i-th
+    output frame corresponds to keyframes[i], so candidates (already snapped
+    to keyframe times) are picked out by index. Returns None on failure.
+    """
+    cmd = [
+        "ffmpeg",
+        "-hide_banner", "-loglevel", "error",
+        "-nostdin",
+        "-skip_frame", "nokey",
+        "-i", path,
+        "-vsync", "passthrough",
+        "-f", "rawvideo",
+        "-pix_fmt", "gray",
+        "-s", f"{RAW_ANALYSIS_WIDTH}x{RAW_ANALYSIS_HEIGHT}",
+        "pipe:1",
+    ]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    out, _ = await proc.communicate()
+    frame_size = RAW_ANALYSIS_WIDTH * RAW_ANALYSIS_HEIGHT
+    n_frames = len(out) // frame_size
+    if proc.returncode != 0 or n_frames == 0:
+        return None
+
+    kf = np.asarray(keyframes[:n_frames])
+    results: List[Tuple[float, np.ndarray]] = []
+    for index in sorted({int(np.abs(kf - t).argmin()) for t in timestamps}):
+        start = index * frame_size
+        gray = np.frombuffer(out[start:start + frame_size], dtype=np.uint8).reshape(
+            RAW_ANALYSIS_HEIGHT, RAW_ANALYSIS_WIDTH,
+        )
+        results.append((float(kf[index]), gray))
+    return results
+
+
+async def grab_candidates_with_ffmpeg(
+    video_url: str,
+    timestamps: List[float],
+    headers: Optional[List[str]] = None,
+) -> List[Tuple[float, np.ndarray]]:
+    """Grab analysis frames via concurrent ffmpeg subprocesses (fallback).
+
+    The grabs are I/O-bound (HTTP seek + single-frame decode), so they run
+    concurrently under a bounded semaphore instead of one after another. Only
+    raw grayscale analysis frames are fetched here; full-resolution JPEGs are
+    grabbed later for the few frames that actually get selected.
+    """
+    semaphore = asyncio.Semaphore(FFMPEG_CONCURRENCY)
+
+    async def grab_one(t: float) -> Optional[Tuple[float, np.ndarray]]:
+        async with semaphore:
+            gray = await ffmpeg_grab_gray_at_async(video_url, t, headers=headers)
+        if gray is None:
+            return None
+        return (float(t), gray)
+
+    grabbed = await asyncio.gather(*(grab_one(t) for t in timestamps))
+    return [item for item in grabbed if item is not None]
+
+
+# Sharpness metrics are resolution-invariant for ranking purposes, so frames
+# are downsampled to this size before convolution (~30x fewer pixels on 1080p).
+ANALYSIS_SIZE = (256, 256)
+
+
+def _sharpness_gray(img: Image.Image) -> np.ndarray:
+    """Convert to a downsampled grayscale int16 array for sharpness metrics."""
+    g = img.convert("L")
+    if g.width > ANALYSIS_SIZE[0] or g.height > ANALYSIS_SIZE[1]:
+        g = g.resize(ANALYSIS_SIZE, Image.Resampling.BILINEAR)
+    return np.asarray(g, dtype=np.int16)
+
+
+def _laplacian_var(g: np.ndarray) -> float:
+    """Variance of Laplacian on a grayscale int16 array.
+
+    The 3x3 Laplacian of uint8 data fits comfortably in int16 (|lap| <= 1020),
+    so the convolution runs on half the bytes of a float32 buffer; only the
+    final variance reduction widens to float64.
+    """
+    lap = ndimage.laplace(g, mode="reflect")
+    return float(np.var(lap, dtype=np.float64))
+
+
+def _gradient_magnitude(g: np.ndarray) -> float:
+    """Mean Sobel gradient magnitude on a grayscale int16 array."""
+    grad_x = ndimage.sobel(g, axis=1, mode="reflect")
+    grad_y = ndimage.sobel(g, axis=0, mode="reflect")
+    magnitude = np.hypot(grad_x, grad_y)
+    return float(magnitude.mean())
+
+
 def image_laplacian_var(img: Image.Image) -> float:
     """Return variance of Laplacian as a sharpness measure."""
-    # convert to grayscale float32
-    g = np.asarray(img.convert("L"), dtype=np.float32)
-    # simple Laplacian kernel
-    kernel = np.array([[0, 1, 0],
-                       [1, -4, 1],
-                       [0, 1, 0]], dtype=np.float32)
-    # convolution
-    from scipy.signal import convolve2d
-    lap = convolve2d(g, kernel, mode="same", boundary="symm")
-    return float(lap.var())
+    return _laplacian_var(_sharpness_gray(img))
 
 
 def image_gradient_magnitude(img: Image.Image) -> float:
     """Calculate gradient magnitude for additional sharpness measurement."""
-    from scipy.signal import convolve2d
-    g = np.asarray(img.convert("L"), dtype=np.float32)
-    
-    # Sobel kernels
-    sobel_x = np.array([[-1, 0, 1],
-                        [-2, 0, 2],
-                        [-1, 0, 1]], dtype=np.float32)
-    sobel_y = np.array([[-1, -2, -1],
-                        [0, 0, 0],
-                        [1, 2, 1]], dtype=np.float32)
-    
-    grad_x = convolve2d(g, sobel_x, mode="same", boundary="symm")
-    grad_y = convolve2d(g, sobel_y, mode="same", boundary="symm")
-    
-    magnitude = np.sqrt(grad_x**2 + grad_y**2)
-    return float(magnitude.mean())
+    return _gradient_magnitude(_sharpness_gray(img))
+
+
+# Static-video probing: number of spread-out candidates fetched first, and the
+# mean pairwise dHash distance (bits) below which the video counts as static.
+STATIC_PROBE_COUNT = 10
+STATIC_DHASH_MIN_DISTANCE = 8
+
+
+def _dhash(gray: np.ndarray) -> int:
+    """Difference hash packed into an int. ~100x cheaper than the DCT pHash."""
+    p = np.asarray(
+        Image.fromarray(gray).resize((9, 8), Image.Resampling.BILINEAR),
+        dtype=np.int16,
+    )
+    bits = (p[:, :-1] > p[:, 1:]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def _mean_pairwise_hamming(hashes: List[int]) -> float:
+    """Mean Hamming distance over all pairs of packed hashes."""
+    total = 0
+    pairs = 0
+    for i in range(len(hashes)):
+        for j in range(i + 1, len(hashes)):
+            total += (hashes[i] ^ hashes[j]).bit_count()
+            pairs += 1
+    return total / pairs if pairs else 0.0
+
+
+def _composite_quality(laplacian_var: float, gradient_mag: float) -> float:
+    """Combine sharpness metrics into a composite score. Higher = better."""
+    # Normalize and combine (weights can be tuned)
+    # Laplacian variance typically ranges 0-10000+, gradient magnitude 0-50+
+    normalized_laplacian = min(laplacian_var / 1000.0, 10.0)  # Cap at 10
+    normalized_gradient = min(gradient_mag / 10.0, 5.0)       # Cap at 5
+
+    # Weighted combination favoring gradient magnitude for blur detection
+    return 0.4 * normalized_laplacian + 0.6 * normalized_gradient
 
 
 def compute_composite_quality_score(img: Image.Image) -> float:
@@ -120,17 +585,8 @@ def compute_composite_quality_score(img: Image.Image) -> float:
     Higher score = better quality.
     """
     try:
-        laplacian_var = image_laplacian_var(img)
-        gradient_mag = image_gradient_magnitude(img)
-        
-        # Normalize and combine (weights can be tuned)
-        # Laplacian variance typically ranges 0-10000+, gradient magnitude 0-50+
-        normalized_laplacian = min(laplacian_var / 1000.0, 10.0)  # Cap at 10
-        normalized_gradient = min(gradient_mag / 10.0, 5.0)       # Cap at 5
-        
-        # Weighted combination favoring gradient magnitude for blur detection
-        composite_score = 0.4 * normalized_laplacian + 0.6 * normalized_gradient
-        return composite_score
+        g = _sharpness_gray(img)
+        return _composite_quality(_laplacian_var(g), _gradient_magnitude(g))
     except Exception:
         return 0.0
 
@@ -141,33 +597,79 @@ def image_brightness(img: Image.Image) -> float:
     return float(g.mean())
 
 
-def phash(img: Image.Image, hash_size: int = 8, highfreq_factor: int = 4) -> np.ndarray:
-    """Perceptual hash (pHash). Based on DCT of a resized image."""
-    import scipy.fft
-    # size for DCT
-    size = hash_size * highfreq_factor
-    img = img.convert("L").resize((size, size), Image.Resampling.LANCZOS)
-    pixels = np.asarray(img, dtype=np.float32)
-    dct = scipy.fft.dct(scipy.fft.dct(pixels, axis=0, norm='ortho'), axis=1, norm='ortho')
+def _phash_from_gray(pixels: np.ndarray, hash_size: int = 8) -> int:
+    """pHash packed into a single int from a grayscale float32 array."""
+    if pixels.shape == (PHASH_SIZE, PHASH_SIZE):
+        # D @ X @ D.T == DCT-II along both axes, but dispatches straight to BLAS
+        dct = _DCT_MATRIX @ pixels @ _DCT_MATRIX.T
+    else:
+        dct = _dct(_dct(pixels, axis=0, norm='ortho'), axis=1, norm='ortho')
     # take top-left block (low frequencies)
     dctlow = dct[:hash_size, :hash_size]
     med = np.median(dctlow[1:, 1:])  # exclude DC
     ph = dctlow > med
-    return ph.flatten()
+    # Pack the 64 bits into one integer so Hamming distance is XOR + popcount
+    return int.from_bytes(np.packbits(ph.flatten()).tobytes(), "big")
+
+
+def phash(img: Image.Image, hash_size: int = 8, highfreq_factor: int = 4) -> int:
+    """Perceptual hash (pHash) as a packed integer. Based on DCT of a resized image."""
+    # size for DCT
+    size = hash_size * highfreq_factor
+    img = img.convert("L").resize((size, size), Image.Resampling.LANCZOS)
+    pixels = np.asarray(img, dtype=np.float32)
+    return _phash_from_gray(pixels, hash_size=hash_size)
 
 
-def hamming(a: np.ndarray, b: np.ndarray) -> int:
-    return int(np.count_nonzero(a != b))
+def _analyze_gray(
+    gray: np.ndarray,
+    bright_min: Optional[float] = None,
+    bright_max: Optional[float] = None,
+) -> Tuple[Optional[float], Optional[float], float, Optional[int]]:
+    """Compute (laplacian_var, gradient_mag, brightness, phash) from one uint8 frame.
+
+    Works directly on the analysis-sized grayscale array produced by the
+    decoders — no JPEG decode, no RGB conversion, no full-resolution buffers.
+
+    Brightness is computed first (a single mean); when a brightness window is
+    given and the frame falls outside it, the convolutions and the DCT are
+    skipped entirely and the remaining metrics come back as None. Black intros
+    and credits can account for 30-50% of candidates, so this avoids most of
+    the wasted convolution work.
+    """
+    brightness = float(gray.mean()) / 255.0
+    if bright_min is not None and bright_max is not None:
+        if not (bright_min <= brightness <= bright_max):
+            return None, None, brightness, None
+
+    # int16 keeps the convolution working set at half the float32 footprint
+    g = gray.astype(np.int16)
+
+    laplacian_var = _laplacian_var(g)
+    gradient_mag = _gradient_magnitude(g)
+
+    hash_pixels = np.asarray(
+        Image.fromarray(gray).resize((32, 32), Image.Resampling.LANCZOS),
+        dtype=np.float32,
+    )
+    ph = _phash_from_gray(hash_pixels)
+
+    return laplacian_var, gradient_mag, brightness, ph
+
+
+def hamming(a: int, b: int) -> int:
+    """Hamming distance between two packed hashes (XOR + popcount)."""
+    return (a ^ b).bit_count()
 
 
 @dataclass
 class FrameCandidate:
     t: float
-    jpeg: bytes
     sharpness: float  # Legacy Laplacian variance
     quality_score: float  # New composite quality score
     brightness: float
-    hash: np.ndarray
+    hash: int  # packed pHash bits
+    jpeg: Optional[bytes] = None  # full-res JPEG, fetched only when selected
 
 
 def select_diverse_topk(cands: List[FrameCandidate], k: int, min_hamm: int, bright_min: float, bright_max: float, min_quality_threshold: float = 0.3) -> List[FrameCandidate]:
@@ -275,48 +777,8 @@ def select_diverse_topk(cands: List[FrameCandidate], k: int, min_hamm: int, brig
 
 
 def compute_max_frames_by_schedule(duration: Optional[float], user_max: Optional[int]) -> int:
-    """
-    Non-linear maximum frame count schedule optimized for your requirements:
-    30s -> max 5, 60s -> max 10, 120s -> max 15, 300s -> max 20, 600s -> max 30
-    
-    These are MAXIMUM allowed frames - the system will extract fewer if:
-    - Not enough diverse frames found (too similar)
-    - Quality threshold not met (too blurry/dark)
-    - Static video detected (minimal variation)
-    
-    Uses logarithmic scaling for better frame distribution on longer videos.
-    """
-    if user_max is not None:
-        return int(user_max)
-    if duration is None:
-        return 15  # fallback
-    
-    d = duration
-    
-    # Handle very short videos
-    if d <= 10:
-        return 3
-    elif d <= 30:
-        # 10-30s: 3 -> 5 frames
-        return int(round(3 + (d - 10) / 20 * 2))
-    elif d <= 60:
-        # 30-60s: 5 -> 10 frames
-        return int(round(5 + (d - 30) / 30 * 5))
-    elif d <= 120:
-        # 60-120s: 10 -> 15 frames
-        return int(round(10 + (d - 60) / 60 * 5))
-    elif d <= 300:
-        # 120-300s: 15 -> 20 frames
-        return int(round(15 + (d - 120) / 180 * 5))
-    elif d <= 600:
-        # 300-600s: 20 -> 30 frames
-        return int(round(20 + (d - 300) / 300 * 10))
-    else:
-        # beyond 10min: logarithmic scaling, capped at 50
-        # This gives diminishing returns for very long videos
-        extra_time = d - 600
-        extra_frames = int(10 * math.log10(1 + extra_time / 600))
-        return int(min(50, 30 + extra_frames))
+    """Maximum frame count schedule; delegates to the shared video_utils table."""
+    return frame_count_for_duration(duration, user_max)
 
 
 async def extract_frames_from_video(
@@ -347,7 +809,7 @@ async def extract_frames_from_video(
     frames_dir.mkdir(exist_ok=True)
     
     # Get video duration
-    duration = run_ffprobe_duration(video_url)
+    duration = await asyncio.to_thread(get_video_duration, video_url)
     
     # Determine maximum allowed frame count
     max_frames = compute_max_frames_by_schedule(duration, target_frames)
@@ -360,51 +822,160 @@ async def extract_frames_from_video(
         max_candidates=cand_max
     )
     
-    # Extract candidate frames
-    candidates: List[FrameCandidate] = []
-    for t in cand_ts:
-        jpeg = ffmpeg_grab_frame_at(video_url, t, jpeg_quality=jpeg_quality, headers=headers)
-        if not jpeg:
-            continue
+    is_local = not _is_remote(video_url)
+
+    # Snap candidates to keyframes when the layout is known: each grab then
+    # decodes exactly one frame, and co-located candidates collapse into one.
+    # Local files only — ffprobe's packet listing demuxes every packet, so on
+    # an HTTP source it would download essentially the whole file first
+    keyframes = (
+        await asyncio.to_thread(run_ffprobe_keyframes, video_url) if is_local else None
+    )
+    if keyframes:
+        cand_ts = snap_timestamps_to_keyframes(cand_ts, keyframes)
+
+    batch_dump: Optional[List[Tuple[float, np.ndarray]]] = None
+    batch_dump_tried = False
+
+    async def fetch_candidates(timestamps: List[float]) -> List[Tuple[float, np.ndarray]]:
+        """Prefer a single PyAV streaming pass, fall back to ffmpeg grabs."""
+        nonlocal batch_dump, batch_dump_tried
+        fetched = await asyncio.to_thread(extract_candidates_with_av, video_url, timestamps)
+        if fetched is None and is_local and keyframes:
+            # Local file: one keyframe-dump process beats per-frame forks.
+            # Dump for the full candidate set on first use so the static
+            # probe and the remainder slice out of the same decode pass
+            if not batch_dump_tried:
+                batch_dump_tried = True
+                batch_dump = await grab_candidates_batch_ffmpeg(video_url, cand_ts, keyframes)
+            if batch_dump is not None:
+                wanted = set(timestamps)
+                fetched = [item for item in batch_dump if item[0] in wanted]
+        if fetched is None:
+            fetched = await grab_candidates_with_ffmpeg(video_url, timestamps, headers=headers)
+        return fetched
+
+    # Probe a handful of spread-out candidates first: if their cheap dHashes
+    # are near-identical the video is static and fetching the remaining ~95%
+    # of candidates would be wasted work
+    probe_step = max(1, len(cand_ts) // STATIC_PROBE_COUNT)
+    probe_ts = cand_ts[::probe_step][:STATIC_PROBE_COUNT]
+    decoded = await fetch_candidates(probe_ts)
+
+    is_static = (
+        len(decoded) >= 3
+        and _mean_pairwise_hamming([_dhash(gray) for _, gray in decoded])
+        < STATIC_DHASH_MIN_DISTANCE
+    )
+    if not is_static:
+        probed = set(probe_ts)
+        decoded += await fetch_candidates([t for t in cand_ts if t not in probed])
+
+    # Analyze candidates in the shared process pool: keeps CPU work off the
+    # event loop and lets it run on other cores, past the GIL
+    loop = asyncio.get_running_loop()
+    executor = _get_frame_executor()
+
+    rejected: List[Tuple[float, np.ndarray, float]] = []
+
+    async def analyze_one(t: float, gray: np.ndarray) -> Optional[FrameCandidate]:
         try:
-            img = Image.open(io.BytesIO(jpeg))
-            img.load()
+            # Single fused grayscale pass for all per-frame metrics
+            sharp, gradient_mag, bright, ph = await loop.run_in_executor(
+                executor, _analyze_gray, gray, bright_min, bright_max,
+            )
         except Exception:
-            continue
-        try:
-            sharp = image_laplacian_var(img)  # Keep for backward compatibility
-            quality_score = compute_composite_quality_score(img)  # New quality metric
-            bright = image_brightness(img)
-            ph = phash(img)
+            return None
+        if sharp is None:
+            # Outside the brightness window; metrics were skipped. Keep the
+            # frame around in case every candidate fails the window
+            rejected.append((t, gray, bright))
+            return None
+        return FrameCandidate(
+            t=float(t),
+            sharpness=sharp,
+            quality_score=_composite_quality(sharp, gradient_mag),
+            brightness=bright,
+            hash=ph,
+        )
+
+    analyzed = await asyncio.gather(*(analyze_one(*item) for item in decoded))
+    del decoded  # release the analysis frames as soon as metrics exist
+    candidates: List[FrameCandidate] = [c for c in analyzed if c is not None]
+
+    if not candidates and rejected:
+        # Entirely dark or overbright video: select_diverse_topk's last
+        # resort still returns 1-2 frames for these, so fully analyze the
+        # few rejects closest to the window and let selection apply it
+        def window_distance(item: Tuple[float, np.ndarray, float]) -> float:
+            bright = item[2]
+            return max(bright_min - bright, bright - bright_max)
+
+        rejected.sort(key=window_distance)
+        for t, gray, _ in rejected[:4]:
+            sharp, gradient_mag, bright, ph = await loop.run_in_executor(
+                executor, _analyze_gray, gray,
+            )
             candidates.append(FrameCandidate(
-                t=float(t), 
-                jpeg=jpeg, 
-                sharpness=sharp, 
-                quality_score=quality_score,
-                brightness=bright, 
-                hash=ph
+                t=float(t),
+                sharpness=sharp,
+                quality_score=_composite_quality(sharp, gradient_mag),
+                brightness=bright,
+                hash=ph,
             ))
-        except Exception:
-            continue
+
+    # Bound the candidate pool at 2k best-by-quality: selection picks at most
+    # k frames, and 2k leaves the diversity filter enough slack while keeping
+    # the selection stage (and the later JPEG re-fetch set) small
+    candidate_pool = max(2 * max_frames, 1)
+    if len(candidates) > candidate_pool:
+        candidates = heapq.nlargest(
+            candidate_pool, candidates, key=lambda c: c.quality_score,
+        )
     
-    # Select diverse frames (up to max_frames, but may be fewer if quality/diversity insufficient)
-    selected = select_diverse_topk(
-        candidates, 
-        k=max_frames, 
-        min_hamm=min_hamm, 
-        bright_min=bright_min, 
-        bright_max=bright_max
-    )
+    if is_static:
+        # Static video: keep only the single best frame from the probe batch
+        selected = (
+            [max(candidates, key=lambda c: c.quality_score)] if candidates else []
+        )
+    else:
+        # Select diverse frames (up to max_frames, but may be fewer if quality/diversity insufficient)
+        selected = select_diverse_topk(
+            candidates,
+            k=max_frames,
+            min_hamm=min_hamm,
+            bright_min=bright_min,
+            bright_max=bright_max
+        )
     
-    # Save frames and collect paths
-    saved_paths = []
+    # Fetch full-resolution JPEGs only for the selected frames (k << candidates)
+    semaphore = asyncio.Semaphore(FFMPEG_CONCURRENCY)
+
+    async def fetch_jpeg(c: FrameCandidate) -> None:
+        if c.jpeg is None:
+            async with semaphore:
+                c.jpeg = await ffmpeg_grab_frame_at_async(
+                    video_url, c.t, jpeg_quality=jpeg_quality, headers=headers,
+                )
+
+    await asyncio.gather(*(fetch_jpeg(c) for c in selected))
+
+    # Batch the writes in a worker thread so the burst of disk I/O (up to
+    # tens of MB of JPEGs) doesn't stall the event loop
+    to_write = []
     for i, c in enumerate(selected, 1):
+        if not c.jpeg:
+            continue
         ts_ms = int(round(c.t * 1000))
         frame_filename = f"{prefix}_{i:03d}_t{ts_ms}ms.jpg"
-        frame_path = frames_dir / frame_filename
-        
-        with open(frame_path, "wb") as f:
-            f.write(c.jpeg)
-        saved_paths.append(str(frame_path))
-    
-    return saved_paths
+        to_write.append((frames_dir / frame_filename, c.jpeg))
+
+    def write_all(pairs: List[Tuple[Path, bytes]]) -> List[str]:
+        written = []
+        for frame_path, jpeg in pairs:
+            with open(frame_path, "wb") as f:
+                f.write(jpeg)
+            written.append(str(frame_path))
+        return written
+
+    return await asyncio.to_thread(write_all, to_write)
@@ -1,15 +1,20 @@
 """Video detection and utility functions."""
 
-import re
+import math
+from bisect import bisect_left
 from pathlib import Path
 from typing import Optional
 
 # Common video file extensions
 VIDEO_EXTENSIONS = {
-    '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm', 
+    '.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv', '.webm',
     '.m4v', '.3gp', '.ogv', '.ts', '.mts', '.m2ts'
 }
 
+# Translation table mapping invalid folder-name characters to underscores,
+# built once at import; str.translate runs the substitution in C.
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 def is_video_file(filename: str) -> bool:
     """Check if a filename has a video extension."""
     if not filename:
@@ -24,46 +29,51 @@ def get_video_stem(filename: str) -> str:
 
 def sanitize_video_folder_name(name: str) -> str:
     """Sanitize a folder name for video frame output."""
-    # Remove invalid characters for folder names
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', name)
-    # Limit length
-    if len(sanitized) > 50:
-        sanitized = sanitized[:50]
-    return sanitized
+    # Replace invalid characters for folder names, limit length
+    return name.translate(_SANITIZE_TABLE)[:50]
 
-def estimate_frame_count_by_duration(duration: Optional[float], user_top: Optional[int] = None) -> int:
+# Frame-count schedule breakpoints: (duration seconds, frame count). Values in
+# between are linearly interpolated; the tail beyond the last breakpoint grows
+# logarithmically and is capped.
+_FRAME_SCHEDULE = [(10.0, 3), (30.0, 5), (60.0, 10), (120.0, 15), (300.0, 20), (600.0, 30)]
+_SCHEDULE_DURATIONS = [point[0] for point in _FRAME_SCHEDULE]
+_MAX_FRAMES_CAP = 50
+
+
+def frame_count_for_duration(duration: Optional[float], user_max: Optional[int] = None) -> int:
     """
-    Estimate number of frames to extract based on video duration.
-    Updated to match your requirements: 30s->5, 60s->10, 120s->15, 300s->20, 600s->30
+    Maximum frame count for a video of the given duration:
+    30s -> max 5, 60s -> max 10, 120s -> max 15, 300s -> max 20, 600s -> max 30
+
+    These are MAXIMUM allowed frames - the extraction pipeline returns fewer if
+    not enough diverse, bright, or sharp frames are found. Beyond 10 minutes
+    the count grows logarithmically and is capped at 50.
     """
-    if user_top is not None:
-        return int(user_top)
+    if user_max is not None:
+        return int(user_max)
     if duration is None:
-        return 15  # Updated fallback
-    
-    d = duration
-    
-    # Handle very short videos
-    if d <= 10:
-        return max(1, int(d / 3))
-    elif d <= 30:
-        # 10-30s: scale to 5 frames at 30s
-        return int(round(3 + (d - 10) / 20 * 2))
-    elif d <= 60:
-        # 30-60s: 5 -> 10 frames
-        return int(round(5 + (d - 30) / 30 * 5))
-    elif d <= 120:
-        # 60-120s: 10 -> 15 frames
-        return int(round(10 + (d - 60) / 60 * 5))
-    elif d <= 300:
-        # 120-300s: 15 -> 20 frames
-        return int(round(15 + (d - 120) / 180 * 5))
-    elif d <= 600:
-        # 300-600s: 20 -> 30 frames
-        return int(round(20 + (d - 300) / 300 * 10))
-    else:
-        # Beyond 10min: logarithmic scaling for diminishing returns
-        import math
-        extra_time = d - 600
-        extra_frames = int(8 * math.log10(1 + extra_time / 300))
-        return int(min(45, 30 + extra_frames))
+        return 15  # fallback
+
+    d = float(duration)
+    if d <= _FRAME_SCHEDULE[0][0]:
+        return _FRAME_SCHEDULE[0][1]
+    if d > _FRAME_SCHEDULE[-1][0]:
+        # Logarithmic tail: diminishing returns for very long videos
+        extra_time = d - _FRAME_SCHEDULE[-1][0]
+        extra_frames = int(10 * math.log10(1 + extra_time / 600))
+        return min(_MAX_FRAMES_CAP, _FRAME_SCHEDULE[-1][1] + extra_frames)
+
+    # Linear interpolation between the surrounding breakpoints
+    i = bisect_left(_SCHEDULE_DURATIONS, d)
+    d0, c0 = _FRAME_SCHEDULE[i - 1]
+    d1, c1 = _FRAME_SCHEDULE[i]
+    return int(round(c0 + (d - d0) / (d1 - d0) * (c1 - c0)))
+
+
+def estimate_frame_count_by_duration(duration: Optional[float], user_top: Optional[int] = None) -> int:
+    """Estimate number of frames to extract based on video duration.
+
+    Kept as an alias of frame_count_for_duration, which both extraction paths
+    now share.
+    """
+    return frame_count_for_duration(duration, user_top)
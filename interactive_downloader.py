@@ -8,21 +8,75 @@ for AI training datasets.
 """
 
 import asyncio
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+import pickle
+import random
+import re
 import sys
+import threading
 import time
 from pathlib import Path
-from urllib.parse import quote
-from typing import List, Set
+from urllib.parse import quote, urlparse
+from typing import Iterator, List, Set
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from selectolax.lexbor import LexborHTMLParser
 
 # Add the current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from helpers.bunkr_utils import get_bunkr_status
 from helpers.config import HEADERS
-from downloader import initialize_managers, validate_and_download
+
+# On-disk cache of search pages so warm reruns of the same query revalidate
+# with ETag/If-Modified-Since (HTTP 304, no body transfer) or skip the
+# request entirely while the entry is still fresh.
+SEARCH_CACHE_FILE = Path.home() / ".cache" / "bunkr" / "search_cache.pickle"
+SEARCH_CACHE_TTL = 3600  # fallback freshness window when no Cache-Control
+
+# Marker recording that the dependency check passed for this interpreter;
+# lets warm launches skip the find_spec probes entirely
+DEPS_MARKER_FILE = Path.home() / ".cache" / "bunkr" / "deps_ok.marker"
+
+# Transient statuses worth retrying: rate limiting and upstream hiccups
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Matches one URL per line in URLs.txt; comment and blank lines simply don't
+# match, so filtering happens inside the regex engine
+URL_LINE_RE = re.compile(rb"^[ \t]*(https?://\S+)[ \t\r]*$", re.M)
+
+# Anchor selector shared by every page scan. Lexbor parsers are single-use
+# (each parse owns its C document, there is no reset/reuse API), so the
+# per-page cost that can be hoisted is this selector, not the parser itself.
+ALBUM_LINK_SELECTOR = "main a[href*='/a/']"
+
+
+class _TokenBucket:
+    """Minimal async token bucket: `rate` requests/second with a small burst."""
+    
+    def __init__(self, rate: float, capacity: float = 5.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate,
+            )
+            self._updated = now
+            if self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+                self._tokens = 0.0
+            else:
+                self._tokens -= 1.0
 
 
 class BunkrSearchScraper:
@@ -31,30 +85,148 @@ class BunkrSearchScraper:
     def __init__(self, 
                  base_url: str = "https://bunkr-albums.io",
                  album_domain: str = "https://bunkr.cr",
-                 delay: float = 0.6):
+                 delay_min: float = 0.3,
+                 delay_max: float = 0.9,
+                 requests_per_second: float = 5.0,
+                 concurrency: int = 5):
         self.base_url = base_url
         self.album_domain = album_domain
-        self.delay = delay
+        self.delay_min = delay_min
+        self.delay_max = delay_max
+        self.requests_per_second = requests_per_second
+        self.concurrency = concurrency
+        # One token bucket per target host so concurrency and per-host request
+        # rate stay independently tunable
+        self._buckets = {}
+        # Albums already seen across the whole crawl, so a URL appearing on
+        # two result pages is only reported (and downloaded) once
+        self._seen: Set[str] = set()
         
-        # Create session with headers
-        self.session = requests.Session()
-        self.session.headers.update({
-            **HEADERS,
-            "Accept-Language": "en-US,en;q=0.9"
-        })
+        # Pooled async client: keep-alive connections are reused across pages
+        # instead of paying a TCP/TLS handshake per request
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={
+                **HEADERS,
+                "Accept-Language": "en-US,en;q=0.9"
+            },
+            timeout=30.0,
+            follow_redirects=True,
+        )
+        self._cache = self._load_cache()
+    
+    async def __aenter__(self) -> "BunkrSearchScraper":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and persist the page cache."""
+        self._save_cache()
+        await self._client.aclose()
+    
+    @staticmethod
+    def _load_cache() -> dict:
+        """Load the persisted URL -> cache-entry dict, if any."""
+        try:
+            with open(SEARCH_CACHE_FILE, "rb") as handle:
+                return pickle.load(handle)
+        except (OSError, pickle.PickleError, EOFError):
+            return {}
+    
+    def _save_cache(self) -> None:
+        """Persist the page cache; failures are non-fatal."""
+        try:
+            SEARCH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(SEARCH_CACHE_FILE, "wb") as handle:
+                pickle.dump(self._cache, handle)
+        except OSError:
+            pass
+    
+    async def _request_with_retry(self, url: str, headers: dict, attempts: int = 5):
+        """GET with exponential backoff on transient 429/5xx responses.
+
+        Honors Retry-After when the server sends one; each retry waits
+        retry_after * 2^attempt plus jitter so a momentary rate limit does
+        not cost a whole page of results.
+        """
+        for attempt in range(attempts):
+            await self._bucket_for(url).acquire()
+            response = await self._client.get(url, headers=headers)
+            if response.status_code not in RETRY_STATUSES or attempt == attempts - 1:
+                return response
+            
+            try:
+                retry_after = float(response.headers.get("Retry-After", 1.0))
+            except ValueError:
+                retry_after = 1.0  # HTTP-date form; a second is close enough
+            await asyncio.sleep(retry_after * 2 ** attempt + random.random())
+        return response
+    
+    def _bucket_for(self, url: str) -> _TokenBucket:
+        """Rate limiter for the URL's host, created on first use."""
+        host = urlparse(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = _TokenBucket(self.requests_per_second)
+        return self._buckets[host]
+    
+    @staticmethod
+    def _checkpoint_path(query: str) -> Path:
+        """Checkpoint file for a query, keyed by a stable digest."""
+        digest = hashlib.blake2b(query.encode("utf-8"), digest_size=8).hexdigest()
+        return Path(f".bunkr_ckpt_{digest}.json")
+    
+    @staticmethod
+    def _max_age(response) -> float:
+        """Freshness window from Cache-Control, or the default TTL."""
+        match = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", ""))
+        return float(match.group(1)) if match else SEARCH_CACHE_TTL
     
     def build_search_url(self, query: str, page: int = 1) -> str:
         """Build search URL for given query and page."""
-        q = quote(query)
+        return self._page_url(f"{self.base_url}/?search={quote(query)}", page)
+    
+    @staticmethod
+    def _page_url(search_base: str, page: int) -> str:
+        """Append the page parameter to an already-encoded search URL."""
         if page == 1:
-            return f"{self.base_url}/?search={q}"
-        return f"{self.base_url}/?search={q}&page={page}"
+            return search_base
+        return f"{search_base}&page={page}"
     
-    def fetch_soup(self, url: str, timeout: int = 30) -> BeautifulSoup:
-        """Fetch and parse HTML from URL."""
-        response = self.session.get(url, timeout=timeout)
+    async def fetch_tree(self, url: str) -> LexborHTMLParser:
+        """Fetch and parse HTML from URL, revalidating against the disk cache."""
+        entry = self._cache.get(url)
+        
+        # Still fresh: skip the request entirely
+        if entry and time.time() - entry["fetched_at"] < entry["max_age"]:
+            return LexborHTMLParser(entry["body"])
+        
+        conditional = {}
+        if entry:
+            if entry.get("etag"):
+                conditional["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                conditional["If-Modified-Since"] = entry["last_modified"]
+        
+        response = await self._request_with_retry(url, conditional)
+        
+        # Not modified: reuse the cached body and restart its freshness window
+        if response.status_code == 304 and entry:
+            entry["fetched_at"] = time.time()
+            return LexborHTMLParser(entry["body"])
+        
         response.raise_for_status()
-        return BeautifulSoup(response.text, "lxml")
+        self._cache[url] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "body": response.content,
+            "fetched_at": time.time(),
+            "max_age": self._max_age(response),
+        }
+        # Hand the raw bytes to lexbor: it detects the encoding itself, so we
+        # skip httpx's full-body unicode decode and the intermediate str copy
+        return LexborHTMLParser(response.content)
     
     def normalize_album_url(self, href: str) -> str:
         """Normalize relative/absolute album URLs."""
@@ -64,65 +236,117 @@ class BunkrSearchScraper:
             return f"{self.album_domain}{href}"
         return href
     
-    def extract_album_urls(self, soup: BeautifulSoup) -> List[str]:
-        """Extract album URLs from search results page."""
-        found_urls = []
-        seen: Set[str] = set()
-        
+    def extract_album_urls(self, tree: LexborHTMLParser) -> Iterator[str]:
+        """Yield album URLs from a search results page not seen earlier in the crawl."""
         # Robust selector: any anchor within <main> whose href contains '/a/'
-        for anchor in soup.select("main a[href*='/a/']"):
-            href = anchor.get("href")
-            if not href:
-                continue
-                
-            # Skip javascript: links
-            if href.startswith("javascript:"):
+        for anchor in tree.css(ALBUM_LINK_SELECTOR):
+            # One dict lookup per anchor; missing and javascript: hrefs share
+            # a single early-out
+            href = anchor.attributes.get("href") or ""
+            if not href or href.startswith("javascript:"):
                 continue
                 
             url = self.normalize_album_url(href)
-            if "/a/" in url and url not in seen:
-                seen.add(url)
-                found_urls.append(url)
-        
-        return found_urls
+            if "/a/" in url and url not in self._seen:
+                self._seen.add(url)
+                yield url
     
-    def scrape_search_results(self, 
-                            query: str, 
-                            max_pages: int = 50,
-                            max_albums: int = None) -> List[str]:
-        """Scrape album URLs from search results."""
+    async def scrape_search_results(self, 
+                                    query: str, 
+                                    max_pages: int = 50,
+                                    max_albums: int = None,
+                                    resume: bool = True) -> List[str]:
+        """Scrape album URLs from search results, fetching pages in batches.
+        
+        Progress is checkpointed to disk after every batch so an interrupted
+        crawl restarts from the last finished page instead of page 1.
+        """
         all_albums = []
+        start_page = 1
+        checkpoint = self._checkpoint_path(query)
+        # urlencode the query once per crawl rather than once per page
+        search_base = f"{self.base_url}/?search={quote(query)}"
         
-        for page in range(1, max_pages + 1):
-            url = self.build_search_url(query, page)
-            print(f"   🔍 Searching page {page}...")
-            
+        if resume and checkpoint.exists():
             try:
-                soup = self.fetch_soup(url)
-                albums = self.extract_album_urls(soup)
+                state = json.loads(checkpoint.read_text(encoding="utf-8"))
+                all_albums = state["albums"]
+                start_page = state["next_page"]
+                # Seed the cross-crawl dedupe set, or shifted listings would
+                # re-append (and later re-download) checkpointed albums
+                self._seen.update(all_albums)
+                print(f"   ♻️  Resuming crawl from page {start_page} "
+                      f"({len(all_albums)} albums already found)")
+            except (OSError, ValueError, KeyError):
+                pass
+        
+        def save_checkpoint(next_page: int) -> None:
+            # Atomic write: never leave a truncated checkpoint behind
+            tmp = checkpoint.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps({"next_page": next_page, "albums": all_albums}),
+                encoding="utf-8",
+            )
+            os.replace(tmp, checkpoint)
+        
+        def finish(albums: List[str]) -> List[str]:
+            checkpoint.unlink(missing_ok=True)
+            return albums
+        
+        # One progress bar instead of 2-4 print (and flush) calls per page
+        from rich.progress import Progress
+        
+        with Progress(transient=True) as progress:
+            task = progress.add_task("🔍 Searching", total=max_pages)
+            if start_page > 1:
+                progress.update(task, completed=start_page - 1)
+            
+            for batch_start in range(start_page, max_pages + 1, self.concurrency):
+                pages = range(batch_start, min(batch_start + self.concurrency, max_pages + 1))
                 
-                if not albums:
-                    print(f"   ℹ️  No more albums found on page {page}")
-                    break
+                trees = await asyncio.gather(
+                    *(self.fetch_tree(self._page_url(search_base, page)) for page in pages),
+                    return_exceptions=True,
+                )
                 
-                all_albums.extend(albums)
-                print(f"   ✅ Found {len(albums)} albums on page {page}")
+                exhausted = False
+                for page, tree in zip(pages, trees):
+                    if isinstance(tree, Exception):
+                        progress.console.print(f"   ❌ Failed to search page {page}: {tree}")
+                        progress.advance(task)
+                        continue
+                    
+                    albums = list(self.extract_album_urls(tree))
+                    if not albums:
+                        # A page of only already-seen albums is not the end of
+                        # the listing; only a page with no album links is
+                        if tree.css_first(ALBUM_LINK_SELECTOR) is None:
+                            exhausted = True
+                            break
+                        progress.advance(task)
+                        continue
+                    
+                    all_albums.extend(albums)
+                    progress.update(
+                        task, advance=1,
+                        description=f"🔍 Searching ({len(all_albums)} albums)",
+                    )
+                    
+                    # Check if we've reached the maximum
+                    if max_albums and len(all_albums) >= max_albums:
+                        return finish(all_albums[:max_albums])
                 
-                # Check if we've reached the maximum
-                if max_albums and len(all_albums) >= max_albums:
-                    all_albums = all_albums[:max_albums]
-                    print(f"   🎯 Reached target of {max_albums} albums")
+                if exhausted:
                     break
                 
-                # Delay between requests
-                if page < max_pages:
-                    time.sleep(self.delay)
-                    
-            except Exception as e:
-                print(f"   ❌ Failed to search page {page}: {e}")
-                continue
+                save_checkpoint(pages.stop)
+                
+                # Jittered delay between batches: less bot-like than a fixed
+                # interval and occasionally faster
+                if pages.stop <= max_pages:
+                    await asyncio.sleep(random.uniform(self.delay_min, self.delay_max))
         
-        return all_albums
+        return finish(all_albums)
 
 
 class InteractiveBunkrDownloader:
@@ -273,11 +497,34 @@ class InteractiveBunkrDownloader:
             else:
                 print("❌ Please enter 'y' or 'n'")
     
+    def _start_search_prefetch(self):
+        """Warm the page-1 cache while the user answers the remaining prompts.
+        
+        Runs a short-lived scraper on a background thread; the fetched page
+        lands in the on-disk cache (still fresh by the time run_download's
+        scraper starts), hiding one network round-trip behind think time.
+        """
+        term = self.config.get('search_term')
+        if not self.config.get('use_search') or not term:
+            return
+        
+        def prefetch():
+            async def warm():
+                async with BunkrSearchScraper() as scraper:
+                    try:
+                        await scraper.fetch_tree(scraper.build_search_url(term, 1))
+                    except Exception:
+                        pass  # purely opportunistic
+            asyncio.run(warm())
+        
+        threading.Thread(target=prefetch, daemon=True, name="bunkr-prefetch").start()
+    
     def configure_interactive(self):
         """Run the interactive configuration process."""
         self.welcome_message()
         self.ask_download_mode()
         self.ask_search_or_browse()
+        self._start_search_prefetch()
         self.ask_album_count()
         self.ask_file_filtering()
         self.display_config_summary()
@@ -292,12 +539,28 @@ class InteractiveBunkrDownloader:
                 self.frames_per_video = None  # Use automatic calculation
                 self.include = config['include']
                 self.ignore = config['ignore']
+                # Precompiled alternations: the downloader's filename filter
+                # becomes one C-level regex scan instead of a substring loop
+                self.include_re = (
+                    re.compile("|".join(re.escape(word) for word in self.include))
+                    if self.include else None
+                )
+                self.ignore_re = (
+                    re.compile("|".join(re.escape(word) for word in self.ignore))
+                    if self.ignore else None
+                )
                 self.disable_ui = False
+                self.concurrency = config.get('concurrency', 5)
         
         return Args(self.config)
     
     async def run_download(self):
         """Execute the download process based on configuration."""
+        # Deferred: pulling in the downloader drags numpy/scipy/PIL along via
+        # the video helpers, which is wasted work if the user never confirms
+        from helpers.bunkr_utils import get_bunkr_status
+        from downloader import initialize_managers, validate_and_download
+        
         try:
             print("🚀 Starting download process...")
             print()
@@ -305,12 +568,12 @@ class InteractiveBunkrDownloader:
             # Get album URLs
             if self.config['use_search'] and self.config['search_term']:
                 print(f"🔍 Searching for: '{self.config['search_term']}'")
-                scraper = BunkrSearchScraper(delay=0.6)
-                album_urls = scraper.scrape_search_results(
-                    query=self.config['search_term'],
-                    max_pages=20,  # Reasonable default
-                    max_albums=self.config['max_albums']
-                )
+                async with BunkrSearchScraper() as scraper:
+                    album_urls = await scraper.scrape_search_results(
+                        query=self.config['search_term'],
+                        max_pages=20,  # Reasonable default
+                        max_albums=self.config['max_albums']
+                    )
             else:
                 # For browse mode, we could implement browsing popular/recent albums
                 # For now, show message that this mode needs URLs.txt
@@ -323,18 +586,19 @@ class InteractiveBunkrDownloader:
                     print(f"❌ Created empty {urls_file.name}. Please add URLs and run again.")
                     return
                 
-                album_urls = []
-                for line in urls_file.read_text().splitlines():
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        album_urls.append(line)
+                # Single C-level regex pass over the raw bytes; islice stops
+                # matching once max_albums URLs have been found
+                album_urls = [
+                    match.group(1).decode()
+                    for match in itertools.islice(
+                        URL_LINE_RE.finditer(urls_file.read_bytes()),
+                        self.config['max_albums'],
+                    )
+                ]
                 
                 if not album_urls:
                     print("❌ No album URLs found in URLs.txt")
                     return
-                
-                # Limit to requested count
-                album_urls = album_urls[:self.config['max_albums']]
             
             if not album_urls:
                 print("❌ No albums found to download")
@@ -348,28 +612,38 @@ class InteractiveBunkrDownloader:
             args = self.create_args_object()
             live_manager = initialize_managers(disable_ui=False)
             
-            # Process each album
+            # Process albums in parallel, bounded by a semaphore so we stay
+            # polite to the server while overlapping independent downloads
+            semaphore = asyncio.Semaphore(args.concurrency)
+            
+            async def download_one(index: int, album_url: str) -> None:
+                async with semaphore:
+                    # Route messages through the live display rather than
+                    # printing underneath it
+                    live_manager.update_log(
+                        "Album started",
+                        f"[{index}/{len(album_urls)}] {album_url}",
+                    )
+                    try:
+                        await validate_and_download(
+                            bunkr_status=bunkr_status,
+                            url=album_url,
+                            live_manager=live_manager,
+                            args=args
+                        )
+                        # Small delay before releasing the slot
+                        await asyncio.sleep(1.0)
+                    except Exception as e:
+                        live_manager.update_log(
+                            "Album failed", f"{album_url}: {e}",
+                        )
+            
             try:
                 with live_manager.live:
-                    for i, album_url in enumerate(album_urls, 1):
-                        print(f"📥 Processing album {i}/{len(album_urls)}: {album_url}")
-                        
-                        try:
-                            await validate_and_download(
-                                bunkr_status=bunkr_status,
-                                url=album_url,
-                                live_manager=live_manager,
-                                args=args
-                            )
-                            
-                            # Small delay between albums
-                            if i < len(album_urls):
-                                await asyncio.sleep(1.0)
-                                
-                        except Exception as e:
-                            print(f"❌ Failed to download album {album_url}: {e}")
-                            continue
-                    
+                    await asyncio.gather(
+                        *(download_one(i, url) for i, url in enumerate(album_urls, 1)),
+                        return_exceptions=True,
+                    )
                     live_manager.stop()
                     
             except KeyboardInterrupt:
@@ -383,22 +657,35 @@ class InteractiveBunkrDownloader:
 
 
 def check_dependencies():
-    """Check if required dependencies are available."""
-    missing = []
+    """Check if required dependencies are installed, without importing them.
     
+    find_spec only consults the import machinery, so startup skips the
+    hundreds of ms (and tens of MB) that actually importing numpy/scipy/rich
+    would cost before the user has even confirmed anything. A successful
+    check is memoized to a marker file keyed by the interpreter, so warm
+    launches skip even the find_spec probes; changing venv or Python
+    version invalidates the marker automatically.
+    """
+    key = hashlib.blake2b(
+        f"{sys.version}|{sys.prefix}".encode(), digest_size=8,
+    ).hexdigest()
     try:
-        import numpy
-        import PIL
-        import scipy
-    except ImportError as e:
-        missing.append("Video frame extraction dependencies (numpy, PIL, scipy)")
+        if DEPS_MARKER_FILE.read_text() == key:
+            return True
+    except OSError:
+        pass
     
-    try:
-        import requests
-        import bs4
-        import rich
-    except ImportError:
-        missing.append("Core dependencies (requests, beautifulsoup4, rich)")
+    dependency_groups = [
+        ("Core dependencies (requests, beautifulsoup4, rich, httpx, selectolax)",
+         ("requests", "bs4", "rich", "httpx", "selectolax")),
+        ("Video frame extraction dependencies (numpy, PIL, scipy)",
+         ("numpy", "PIL", "scipy")),
+    ]
+    missing = [
+        label
+        for label, modules in dependency_groups
+        if any(importlib.util.find_spec(module) is None for module in modules)
+    ]
     
     if missing:
         print("❌ Missing dependencies:")
@@ -407,11 +694,24 @@ def check_dependencies():
         print("\n💡 Install with: pip install -r requirements.txt")
         return False
     
+    try:
+        DEPS_MARKER_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DEPS_MARKER_FILE.write_text(key)
+    except OSError:
+        pass
     return True
 
 
 def main():
     """Main entry point."""
+    # libuv-based event loop: drop-in replacement that handles the concurrent
+    # page fetches and album downloads with less per-task overhead
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass  # optional; the default selector loop works fine
+    
     if not check_dependencies():
         sys.exit(1)
     